@@ -1,31 +1,84 @@
 import Config
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from common import PriceInfo, TokenOverview
 from decimal import Decimal
 from custom_exceptions import NoPositionsError, InvalidTokens, InvalidSolanaAddress
-from vars.constants import BASE_PRICES_MULTI_URL, BASE_TOKEN_OVERVIEW_URL
+from utils.helpers import CACHE_MISS, TTLCache
+from vars.constants import BASE_PRICES_MULTI_URL, BASE_TOKEN_OVERVIEW_URL, PRICE_CACHE_MAXSIZE, PRICE_CACHE_TTL
+
+# BirdEye caps multi_price at ~100 comma-separated addresses per request
+MAX_ADDRESSES_PER_REQUEST = 100
+
+# Above this many addresses per chunk, stream-parse the response instead
+# of buffering the whole body before decoding
+STREAM_PARSE_THRESHOLD = 50
+
+def _stream_kvitems(raw):
+    """
+    Iterates (token_address, info) pairs from a streamed multi_price body,
+    translating decode and transport failures to InvalidTokens the same
+    way the buffered path does; ijson is imported here so the module
+    loads without it installed
+
+    Args:
+        raw: File-like raw response stream to parse
+
+    Yields:
+        tuple[str, dict]: Address and price entry pairs from the data object
+
+    Raises:
+        InvalidTokens: If the body is malformed or the connection drops mid-stream
+    """
+    import ijson
+    from urllib3.exceptions import HTTPError
+
+    try:
+        yield from ijson.kvitems(raw, "data")
+    except (ijson.JSONError, HTTPError):
+        raise InvalidTokens()
+
 class BirdEyeClient:
     """
     Handler class to assist with all calls to BirdEye API
     """
 
-    @property
-    def _headers(self):
-        return {
+    def __init__(self):
+        # Built once: these never change for the lifetime of the client
+        self._headers = {
             "accept": "application/json",
+            "accept-encoding": "gzip",
             "x-chain": "solana",
             "X-API-KEY": Config.BIRD_EYE_TOKEN,
         }
+        # Reuse one session so consecutive calls share pooled
+        # keep-alive connections instead of re-doing TCP+TLS setup
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(
+                total=5,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=["GET", "POST"],
+                respect_retry_after_header=True,
+            ),
+        )
+        self._session.mount("https://", adapter)
+        self._session.headers.update(self._headers)
+        self._methods = {"GET": self._session.get, "POST": self._session.post}
+        self._price_cache = TTLCache(maxsize=PRICE_CACHE_MAXSIZE, ttl=PRICE_CACHE_TTL)
+        self._overview_cache = TTLCache(maxsize=PRICE_CACHE_MAXSIZE, ttl=PRICE_CACHE_TTL)
 
     def _make_api_call(self, method: str, query_url: str, *args, **kwargs) -> requests.Response:
-        match method.upper():
-            case "GET":
-                query_method = requests.get
-            case "POST":
-                query_method = requests.post
-            case _:
-                raise ValueError(f'Unrecognised method "{method}" passed for query - {query_url}')
-        resp = query_method(query_url, *args, headers=self._headers, **kwargs)
+        try:
+            query_method = self._methods[method.upper()]
+        except KeyError:
+            raise ValueError(f'Unrecognised method "{method}" passed for query - {query_url}') from None
+        resp = query_method(query_url, *args, **kwargs)
         return resp
 
     def fetch_prices(self, token_addresses: list[str]) -> dict[str, PriceInfo[Decimal, Decimal]]:
@@ -37,7 +90,7 @@ class BirdEyeClient:
             token_addresses (list[str]): A list of tokens for which to fetch prices
 
         Returns:
-           dict[str, dict[str, PriceInfo[Decimal, Decimal]]: Mapping of token to a named tuple PriceInfo with price and liquidity
+           dict[str, dict[str, PriceInfo[Decimal, Decimal]]: Mapping of token to a PriceInfo with price and liquidity exposed as lazy Decimals
 
         Raises:
             NoPositionsError: Raise if no tokens are provided
@@ -48,30 +101,69 @@ class BirdEyeClient:
             # Raise if no tokens are provided
             raise NoPositionsError()
 
-        prices = {}
+        # Order-preserving dedup so repeated mints cost one lookup
+        unique_addresses = list(dict.fromkeys(token_addresses))
 
-        try:
-            query_url = BASE_PRICES_MULTI_URL + "&list_address=" + ",".join(token_addresses)
-            resp = self._make_api_call("GET", query_url)
-            resp.raise_for_status()
-            data = resp.json()
+        prices = {}
+        misses = []
+        for token_address in unique_addresses:
+            cached = self._price_cache.get(token_address, CACHE_MISS)
+            if cached is not CACHE_MISS:
+                prices[token_address] = cached
+            else:
+                misses.append(token_address)
+
+        if not misses:
+            return prices
 
-            if not data.get("success", False):
-                raise InvalidTokens()
-                
+        # Hoist loop invariants so the parse loop avoids repeated
+        # global and attribute lookups per token
+        _PriceInfo = PriceInfo
+        price_cache = self._price_cache
 
-            for token_address, info in data["data"].items():
-                if info:
-                    value = Decimal(info.get("value", None))
-                    liquidity = Decimal(info.get("liquidity", None))
-                    price_info = PriceInfo(value=value, liquidity=liquidity)
-                    prices[token_address] = price_info
+        try:
+            for i in range(0, len(misses), MAX_ADDRESSES_PER_REQUEST):
+                chunk = misses[i:i + MAX_ADDRESSES_PER_REQUEST]
+                params = {"include_liquidity": "true", "list_address": ",".join(chunk)}
+
+                streamed = len(chunk) > STREAM_PARSE_THRESHOLD
+                if streamed:
+                    # Stream-parse so JSON decode overlaps the TCP receive and
+                    # the full body never has to sit in memory at once
+                    resp = self._make_api_call("GET", BASE_PRICES_MULTI_URL, params=params, stream=True)
+                    resp.raise_for_status()
+                    resp.raw.decode_content = True
+                    items = _stream_kvitems(resp.raw)
                 else:
-                    prices[token_address] = None
+                    resp = self._make_api_call("GET", BASE_PRICES_MULTI_URL, params=params)
+                    resp.raise_for_status()
+                    data = orjson.loads(resp.content)
+
+                    if not data.get("success", False):
+                        raise InvalidTokens()
+
+                    items = data["data"].items()
+
+                parsed_any = False
+                for token_address, info in items:
+                    parsed_any = True
+                    if not info:
+                        prices[token_address] = None
+                        price_cache[token_address] = None
+                        continue
+                    price_info = _PriceInfo(value=info.get("value"), liquidity=info.get("liquidity"))
+                    prices[token_address] = price_info
+                    price_cache[token_address] = price_info
+
+                if streamed and not parsed_any:
+                    # BirdEye signals failure as HTTP 200 with success=false
+                    # and no data entries; the buffered path checks the flag,
+                    # so an empty stream for a non-empty chunk must fail too
+                    raise InvalidTokens()
 
             return prices
 
-        except requests.RequestException as e:
+        except (requests.RequestException, orjson.JSONDecodeError) as e:
             # Raised if the API call was unsuccessful
             raise InvalidTokens()
 
@@ -100,11 +192,14 @@ class BirdEyeClient:
         if not address:
             raise InvalidSolanaAddress
 
+        cached = self._overview_cache.get(address, CACHE_MISS)
+        if cached is not CACHE_MISS:
+            return cached
+
         try:
-            query_url = BASE_TOKEN_OVERVIEW_URL + '?address=' + address
-            resp = self._make_api_call("GET", query_url)
+            resp = self._make_api_call("GET", BASE_TOKEN_OVERVIEW_URL, params={"address": address})
             resp.raise_for_status()
-            data = resp.json()
+            data = orjson.loads(resp.content)
 
             if not data.get("success", False):
                 raise InvalidTokens()
@@ -122,8 +217,9 @@ class BirdEyeClient:
                 supply=token_data.get("supply", "")
             )
 
+            self._overview_cache[address] = token_overview
             return token_overview
 
-        except requests.RequestException as e:
+        except (requests.RequestException, orjson.JSONDecodeError) as e:
             # Raise InvalidTokens if API call was unsuccessful
             raise InvalidTokens()
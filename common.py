@@ -1,4 +1,62 @@
-from collections import namedtuple
+from decimal import Decimal
+from functools import cached_property
+from types import GenericAlias
 
-PriceInfo = namedtuple("PriceInfo", ["value", "liquidity"])
-TokenOverview = namedtuple("TokenOverview", ["price", "symbol", "decimals", "lastTradeUnixTime", "liquidity", "supply"])
+
+class PriceInfo:
+    """
+    Price and liquidity of a token
+
+    Raw API values are stored as received and only promoted to
+    Decimal on first access, keeping the construction cost out of
+    the parse loop for fields callers never read
+    """
+
+    __class_getitem__ = classmethod(GenericAlias)
+
+    def __init__(self, value, liquidity):
+        self._raw_value = value
+        self._raw_liquidity = liquidity
+
+    @cached_property
+    def value(self) -> Decimal:
+        return Decimal(str(self._raw_value)) if self._raw_value is not None else Decimal(0)
+
+    @cached_property
+    def liquidity(self) -> Decimal:
+        return Decimal(str(self._raw_liquidity)) if self._raw_liquidity is not None else Decimal(0)
+
+    def __repr__(self):
+        return f"PriceInfo(value={self._raw_value!r}, liquidity={self._raw_liquidity!r})"
+
+
+class TokenOverview:
+    """
+    Overview of a token with price
+    and liquidity promoted to Decimal
+    lazily like PriceInfo
+    """
+
+    __class_getitem__ = classmethod(GenericAlias)
+
+    def __init__(self, price, symbol, decimals, lastTradeUnixTime, liquidity, supply):
+        self._raw_price = price
+        self.symbol = symbol
+        self.decimals = decimals
+        self.lastTradeUnixTime = lastTradeUnixTime
+        self._raw_liquidity = liquidity
+        self.supply = supply
+
+    @cached_property
+    def price(self) -> Decimal:
+        return Decimal(str(self._raw_price)) if self._raw_price is not None else Decimal(0)
+
+    @cached_property
+    def liquidity(self) -> Decimal:
+        return Decimal(str(self._raw_liquidity)) if self._raw_liquidity is not None else Decimal(0)
+
+    def __repr__(self):
+        return (
+            f"TokenOverview(price={self._raw_price!r}, symbol={self.symbol!r}, decimals={self.decimals!r}, "
+            f"lastTradeUnixTime={self.lastTradeUnixTime!r}, liquidity={self._raw_liquidity!r}, supply={self.supply!r})"
+        )
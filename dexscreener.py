@@ -2,25 +2,58 @@
 Client for DexScreener APIs
 """
 
+import asyncio
 from decimal import Decimal
 from typing import Any
+import aiohttp
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from common import PriceInfo, TokenOverview
 from custom_exceptions import InvalidSolanaAddress, InvalidTokens, NoPositionsError
-from utils.helpers import is_solana_address
-from vars.constants import SOL_MINT, BASE_DEX_URL
+from utils.helpers import CACHE_MISS, SOLANA_ADDRESS_RE, TTLCache, is_solana_address
+from vars.constants import SOL_MINT, BASE_DEX_URL, PRICE_CACHE_MAXSIZE, PRICE_CACHE_TTL
+
+# DexScreener accepts up to 30 comma-separated addresses per request
+MAX_ADDRESSES_PER_REQUEST = 30
+
+# Retry policy for the aiohttp path, mirroring the adapter mounted on
+# the requests session
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+ASYNC_RETRY_TOTAL = 5
+ASYNC_BACKOFF_FACTOR = 0.5
 
 class DexScreenerClient:
     """
     Handler class to assist with all calls to DexScreener API
     """
 
-    @property
-    def _headers(self):
-        return {
+    def __init__(self):
+        # Built once: these never change for the lifetime of the client
+        self._headers = {
             "accept": "application/json",
+            "accept-encoding": "gzip",
         }
+        # Reuse one session so consecutive calls share pooled
+        # keep-alive connections instead of re-doing TCP+TLS setup
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(
+                total=5,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=["GET", "POST"],
+                respect_retry_after_header=True,
+            ),
+        )
+        self._session.mount("https://", adapter)
+        self._session.headers.update(self._headers)
+        self._price_cache = TTLCache(maxsize=PRICE_CACHE_MAXSIZE, ttl=PRICE_CACHE_TTL)
+        self._overview_cache = TTLCache(maxsize=PRICE_CACHE_MAXSIZE, ttl=PRICE_CACHE_TTL)
 
     @staticmethod
     def _validate_token_address(token_address: str):
@@ -41,7 +74,7 @@ class DexScreenerClient:
             raise NoPositionsError()
 
         if not is_solana_address(token_address):
-            raise InvalidSolanaAddress()
+            raise InvalidSolanaAddress(token_address)
         
         return None
 
@@ -64,12 +97,13 @@ class DexScreenerClient:
         if not token_addresses:
             raise NoPositionsError()
 
-        for token_address in token_addresses:
-            if not token_address:
-                raise NoPositionsError()
+        if any(not token_address for token_address in token_addresses):
+            raise NoPositionsError()
 
-            if not is_solana_address(token_address):
-                raise InvalidSolanaAddress()
+        match = SOLANA_ADDRESS_RE.match
+        invalid = next((token_address for token_address in token_addresses if not match(token_address)), None)
+        if invalid is not None:
+            raise InvalidSolanaAddress(invalid)
 
         return None
 
@@ -109,9 +143,9 @@ class DexScreenerClient:
         self._validate_token_address(token_address)
 
         url = BASE_DEX_URL + token_address
-        response = requests.get(url, headers=self._headers)
+        response = self._session.get(url)
         self._validate_response(response)
-        data = response.json()
+        data = orjson.loads(response.content)
         return data
 
 
@@ -133,11 +167,96 @@ class DexScreenerClient:
         self._validate_token_addresses(token_addresses)
 
         url = BASE_DEX_URL + ",".join(token_addresses)
-        response = requests.get(url, headers=self._headers)
+        response = self._session.get(url)
         self._validate_response(response)
-        data = response.json()
+        data = orjson.loads(response.content)
         return data
 
+    async def _afetch_chunk(self, session: aiohttp.ClientSession, token_addresses: list[str]) -> dict[str, PriceInfo]:
+        """
+        Fetches and parses price data for up to MAX_ADDRESSES_PER_REQUEST tokens in one request
+
+        Args:
+            session (aiohttp.ClientSession): Session shared by the whole batch
+            token_addresses (list[str]): Token addresses for which to fetch data
+
+        Returns:
+            dict[str, PriceInfo]: Mapping of token to a PriceInfo with price and liquidity exposed as lazy Decimals
+
+        Raises:
+            InvalidTokens: If response is not 200 after retries
+        """
+        url = BASE_DEX_URL + ",".join(token_addresses)
+
+        for attempt in range(ASYNC_RETRY_TOTAL + 1):
+            async with session.get(url) as resp:
+                if resp.status == 200:
+                    raw = await resp.read()
+                    break
+                if resp.status not in RETRYABLE_STATUS_CODES or attempt == ASYNC_RETRY_TOTAL:
+                    raise InvalidTokens()
+                retry_after = resp.headers.get("Retry-After")
+
+            # Honour Retry-After when the server sends one, otherwise
+            # back off exponentially like the requests adapter
+            try:
+                delay = float(retry_after)
+            except (TypeError, ValueError):
+                delay = ASYNC_BACKOFF_FACTOR * (2 ** attempt)
+            await asyncio.sleep(delay)
+
+        # Decode and parse on a worker thread so the event loop keeps
+        # servicing the other in-flight chunk requests meanwhile
+        data = await asyncio.to_thread(orjson.loads, raw)
+        return await asyncio.to_thread(self._build_chunk_prices, data, token_addresses)
+
+    def _build_chunk_prices(self, data: dict[str, Any], token_addresses: list[str]) -> dict[str, PriceInfo]:
+        """
+        Builds the per-address PriceInfo mapping from one bulk response
+
+        Args:
+            data (dict[str, Any]): Decoded JSON response from the bulk endpoint
+            token_addresses (list[str]): Addresses the chunk was requested for
+
+        Returns:
+            dict[str, PriceInfo]: Mapping of token to a PriceInfo with price and liquidity
+        """
+        pairs = data.get("pairs") or []
+        prices = {}
+        for token_address in token_addresses:
+            pair = self.find_largest_pool(pairs, token_address)
+            if not pair:
+                prices[token_address] = None
+                continue
+            price_usd = pair["priceUsd"] if "priceUsd" in pair else 0
+            liquidity_usd = pair["liquidity"]["usd"] if "liquidity" in pair and "usd" in pair["liquidity"] else 0
+            prices[token_address] = PriceInfo(value=price_usd, liquidity=liquidity_usd)
+        return prices
+
+    async def _afetch_prices(self, token_addresses: list[str]) -> dict[str, PriceInfo]:
+        """
+        Fetches prices for all tokens concurrently, one bulk request per chunk of addresses
+
+        Args:
+            token_addresses (list[str]): A list of tokens for which to fetch prices
+
+        Returns:
+            dict[str, PriceInfo]: Mapping of token to a PriceInfo with price and liquidity exposed as lazy Decimals
+        """
+        chunks = [
+            token_addresses[i:i + MAX_ADDRESSES_PER_REQUEST]
+            for i in range(0, len(token_addresses), MAX_ADDRESSES_PER_REQUEST)
+        ]
+        connector = aiohttp.TCPConnector(limit=20)
+        async with aiohttp.ClientSession(headers=self._headers, connector=connector) as session:
+            tasks = [self._afetch_chunk(session, chunk) for chunk in chunks]
+            results = await asyncio.gather(*tasks)
+
+        prices = {}
+        for chunk_prices in results:
+            prices.update(chunk_prices)
+        return prices
+
     def fetch_prices_dex(self, token_addresses: list[str]) -> dict[str, PriceInfo[Decimal, Decimal]]:
         """
         For a list of tokens fetches their prices
@@ -147,19 +266,28 @@ class DexScreenerClient:
             token_addresses (list[str]): A list of tokens for which to fetch prices
 
         Returns:
-           dict[str, dict[Decimal, PriceInfo[str, Decimal]]: Mapping of token to a named tuple PriceInfo with price and liquidity in Decimal
+           dict[str, dict[Decimal, PriceInfo[str, Decimal]]: Mapping of token to a PriceInfo with price and liquidity exposed as lazy Decimals
 
         """
         self._validate_token_addresses(token_addresses)
-        prices = {}
 
-        for token_address in token_addresses:
-            data = self._call_api(token_address)
-            price_usd = Decimal(data["pairs"][0]["priceUsd"]) if "priceUsd" in data["pairs"][0] else Decimal(0.0)
-            liquidity_usd = Decimal(data["pairs"][0]["liquidity"]["usd"]) if "liquidity" in data["pairs"][0] and "usd" in data["pairs"][0]["liquidity"] else Decimal(0.0)
+        # Order-preserving dedup so repeated mints cost one lookup
+        unique_addresses = list(dict.fromkeys(token_addresses))
 
-            price_info = PriceInfo(value=price_usd, liquidity=liquidity_usd)
-            prices[token_address] = price_info
+        prices = {}
+        misses = []
+        for token_address in unique_addresses:
+            cached = self._price_cache.get(token_address, CACHE_MISS)
+            if cached is not CACHE_MISS:
+                prices[token_address] = cached
+            else:
+                misses.append(token_address)
+
+        if misses:
+            fetched = asyncio.run(self._afetch_prices(misses))
+            for token_address, price_info in fetched.items():
+                self._price_cache[token_address] = price_info
+            prices.update(fetched)
         return prices
 
 
@@ -177,13 +305,17 @@ class DexScreenerClient:
         """
         self._validate_token_address(address)
 
+        cached = self._overview_cache.get(address, CACHE_MISS)
+        if cached is not CACHE_MISS:
+            return cached
+
         data = self._call_api(address)
 
         if "pairs" in data and data["pairs"]:
             pair = data["pairs"][0]
             base_token = pair["baseToken"]
-            price_usd = Decimal(pair.get("priceUsd", 0))
-            liquidity_usd = Decimal(pair["liquidity"].get("usd", 0))
+            price_usd = pair.get("priceUsd", 0)
+            liquidity_usd = pair["liquidity"].get("usd", 0)
             supply = pair.get("supply", "")
 
             token_overview = TokenOverview(
@@ -195,18 +327,76 @@ class DexScreenerClient:
                 supply=supply
             )
 
+            self._overview_cache[address] = token_overview
             return token_overview
 
 
+    def fetch_price_and_overview(self, token_addresses: list[str]) -> dict[str, tuple[PriceInfo, TokenOverview] | None]:
+        """
+        For a list of tokens fetches both price and overview
+        from the same bulk response, halving round-trips for
+        callers that need the two together
+
+        Args:
+            token_addresses (list[str]): A list of tokens for which to fetch price and overview
+
+        Returns:
+            dict[str, tuple[PriceInfo, TokenOverview] | None]: Mapping of token to a (PriceInfo, TokenOverview) pair, or None if no pair was found
+        """
+        self._validate_token_addresses(token_addresses)
+        unique_addresses = list(dict.fromkeys(token_addresses))
+
+        results = {}
+        for i in range(0, len(unique_addresses), MAX_ADDRESSES_PER_REQUEST):
+            chunk = unique_addresses[i:i + MAX_ADDRESSES_PER_REQUEST]
+            data = self._call_api_bulk(chunk)
+            pairs = data.get("pairs") or []
+
+            for token_address in chunk:
+                pair = self.find_largest_pool(pairs, token_address)
+                if not pair:
+                    results[token_address] = None
+                    continue
+
+                base_token = pair.get("baseToken", {})
+                price_usd = pair.get("priceUsd", 0)
+                liquidity_usd = pair.get("liquidity", {}).get("usd", 0)
+
+                price_info = PriceInfo(value=price_usd, liquidity=liquidity_usd)
+                token_overview = TokenOverview(
+                    price=price_usd,
+                    symbol=base_token.get("symbol", ""),
+                    decimals=base_token.get("decimals", ""),
+                    lastTradeUnixTime=pair.get("pairCreatedAt", None),
+                    liquidity=liquidity_usd,
+                    supply=pair.get("supply", "")
+                )
+
+                self._price_cache[token_address] = price_info
+                self._overview_cache[token_address] = token_overview
+                results[token_address] = (price_info, token_overview)
+
+        return results
+
+
+    @staticmethod
+    def _liquidity_usd(entry):
+        return float(entry.get("liquidity", {}).get("usd", 0) or 0)
+
+    @staticmethod
+    def find_largest_pool(token_pairs, address):
+        candidates = (
+            entry for entry in token_pairs
+            if entry.get("baseToken", {}).get("address") == address
+        )
+        return max(candidates, key=DexScreenerClient._liquidity_usd, default={})
+
     @staticmethod
     def find_largest_pool_with_sol(token_pairs, address):
-        max_entry = {}
-        max_liquidity_usd = -1
-
-        for entry in token_pairs:
-            if entry.get("baseToken", {}).get("address") == address and entry["quoteToken"]["address"] == SOL_MINT:
-                liquidity_usd = float(entry.get("liquidity", {}).get("usd", 0))
-                if liquidity_usd > max_liquidity_usd:
-                    max_liquidity_usd = liquidity_usd
-                    max_entry = entry
-        return max_entry
+        sol_mint = SOL_MINT
+        candidates = (
+            entry for entry in token_pairs
+            if entry.get("baseToken", {}).get("address") == address
+            and entry["quoteToken"]["address"] == sol_mint
+        )
+        return max(candidates, key=DexScreenerClient._liquidity_usd, default={})
@@ -3,11 +3,12 @@ from birdeye import BirdEyeClient
 from common import PriceInfo 
 from dexscreener import DexScreenerClient
 
-def testBirdeyeClient():
+# One client for the whole process so the pooled session and
+# TTL caches survive across calls
+# client = BirdEyeClient()
+client = DexScreenerClient()
 
-    # Instantiate BirdEyeClient
-    # client = BirdEyeClient()
-    client = DexScreenerClient()
+def testBirdeyeClient(client=client):
 
     token_addresses = ["WskzsKqEW3ZsmrhPAevfVZb6PuuLzWov9mJWZsfDePC", "2uvch6aviS6xE3yhWjVZnFrDw7skUtf6ubc7xYJEPpwj", "EKpQGSJtjMFqKZ9KQanSqYXRcF8fBopzLHYxdM65zcjm", "2LxZrcJJhzcAju1FBHuGvw929EVkX7R7Q8yA2cdp8q7b"]
 
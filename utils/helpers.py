@@ -1,9 +1,56 @@
-import PubKey
+import re
+import time
+
+# Base58 alphabet, 32-44 chars: the shape of a solana public key
+SOLANA_ADDRESS_RE = re.compile(r"^[1-9A-HJ-NP-Za-km-z]{32,44}$")
+
+# Sentinel distinguishing a cache miss from a cached None
+CACHE_MISS = object()
 
 def is_solana_address(input_string: str) -> bool:
-    try:
-        Pubkey.from_string(input_string)
+    return SOLANA_ADDRESS_RE.match(input_string) is not None
+
+
+class TTLCache:
+    """
+    Minimal time-bounded mapping
+    so repeat lookups within the TTL
+    can skip network I/O entirely
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._entries = {}
+
+    def __contains__(self, key) -> bool:
+        entry = self._entries.get(key)
+        if entry is None:
+            return False
+        if entry[0] < time.monotonic():
+            del self._entries[key]
+            return False
         return True
-    except ValueError:
-        return False
-    
\ No newline at end of file
+
+    def __getitem__(self, key):
+        value = self.get(key, CACHE_MISS)
+        if value is CACHE_MISS:
+            raise KeyError(key)
+        return value
+
+    def get(self, key, default=None):
+        # Single expiry check so a hit can't expire between a
+        # containment test and the read
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+        if entry[0] < time.monotonic():
+            del self._entries[key]
+            return default
+        return entry[1]
+
+    def __setitem__(self, key, value):
+        if key not in self._entries and len(self._entries) >= self._maxsize:
+            # evict the oldest insertion to stay within bounds
+            del self._entries[next(iter(self._entries))]
+        self._entries[key] = (time.monotonic() + self._ttl, value)
@@ -1,4 +1,6 @@
 SOL_MINT = "So11111111111111111111111111111111111111112"
 BASE_TOKEN_OVERVIEW_URL = "https://public-api.birdeye.so/defi/token_overview"
-BASE_PRICES_MULTI_URL = "https://public-api.birdeye.so/defi/multi_price?include_liquidity=true"
-BASE_DEX_URL = "https://api.dexscreener.io/latest/dex/tokens/"
\ No newline at end of file
+BASE_PRICES_MULTI_URL = "https://public-api.birdeye.so/defi/multi_price"
+BASE_DEX_URL = "https://api.dexscreener.io/latest/dex/tokens/"
+PRICE_CACHE_TTL = 30
+PRICE_CACHE_MAXSIZE = 2048